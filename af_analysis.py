@@ -15,12 +15,17 @@ import json
 import statistics
 import math
 import logging
+import sys
 import threading
 import time
 from pathlib import Path
+from bisect import bisect_right
 from collections import defaultdict
 
-from af_config import LOG_DIR, CONFIG_DIR, _get_config_value, _last_change_for, load_csv_rows
+from af_config import (
+    LOG_DIR, CONFIG_DIR, _get_config_value, _last_change_for, load_csv_rows,
+    _newest_matching,
+)
 
 
 # =============================================================================
@@ -59,14 +64,38 @@ def _cache_invalidate(prefix=None):
                     del _cache_store[k]
 
 
+# =============================================================================
+# STREAMING STATISTICS
+# =============================================================================
+
+class _RunningStats:
+    """Single-pass mean / sample stdev (Welford's algorithm).
+
+    Lets analyzers fold values in as rows are read instead of building a
+    list per column and walking it again for each statistic.
+    """
+    __slots__ = ('n', 'mean', 'm2')
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def stdev(self):
+        """Sample standard deviation (matches ``statistics.stdev``)."""
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+
 def find_latest_summary(log_dir):
     """Find the most recent *_summary.json file."""
-    summaries = sorted(
-        Path(log_dir).glob('*_summary.json'),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-    return str(summaries[0]) if summaries else None
+    return _newest_matching(log_dir, lambda name: name.endswith('_summary.json'))
 
 
 def load_summary(path):
@@ -85,8 +114,11 @@ def load_summary(path):
 
 def print_single_summary(summary, path):
     """Display a concise health summary for one print."""
-    print(f"\nFile: {os.path.basename(path)}")
-    print("=" * 60)
+    # Build the report and write it once rather than one print() per line.
+    out = []
+    emit = out.append
+    emit(f"\nFile: {os.path.basename(path)}")
+    emit("=" * 60)
 
     material = summary.get('material', 'Unknown')
     duration = summary.get('duration_min', 0)
@@ -96,30 +128,30 @@ def print_single_summary(summary, path):
     avg_pwm   = summary.get('avg_pwm', 0)
     max_pwm   = summary.get('max_pwm', 0)
 
-    print(f"Material : {material}")
-    print(f"Duration : {duration:.1f} min  ({samples} samples)")
-    print(f"Boost    : avg {avg_boost:.1f}\u00b0C / max {max_boost:.1f}\u00b0C")
-    print(f"Heater   : avg {avg_pwm:.0%} / max {max_pwm:.0%}")
+    emit(f"Material : {material}")
+    emit(f"Duration : {duration:.1f} min  ({samples} samples)")
+    emit(f"Boost    : avg {avg_boost:.1f}\u00b0C / max {max_boost:.1f}\u00b0C")
+    emit(f"Heater   : avg {avg_pwm:.0%} / max {max_pwm:.0%}")
 
     # Speed Guard
     dynz_pct  = summary.get('dynz_active_pct', 0)
     accel_min = summary.get('accel_min', 0)
     if dynz_pct > 0:
-        print(f"Speed Guard: active {dynz_pct}% of print, min accel {accel_min} mm/s\u00b2")
+        emit(f"Speed Guard: active {dynz_pct}% of print, min accel {accel_min} mm/s\u00b2")
     else:
-        print(f"Speed Guard: inactive (no stress zones)")
+        emit(f"Speed Guard: inactive (no stress zones)")
 
     # Banding summary from extruder_monitor
     ba = summary.get('banding_analysis', {})
     if ba:
         hr = ba.get('high_risk_events', 0)
         culprit = ba.get('likely_culprit', 'none')
-        print(f"Legacy   : {hr} risk events (deprecated \u2014 see Quality Score)")
+        emit(f"Legacy   : {hr} risk events (deprecated \u2014 see Quality Score)")
     else:
-        print("Legacy   : no banding data")
+        emit("Legacy   : no banding data")
 
     # Quick health verdict
-    print()
+    emit('')
     warnings = []
     if max_pwm > 0.95:
         warnings.append("Heater near saturation (max PWM > 95%)")
@@ -130,11 +162,12 @@ def print_single_summary(summary, path):
 
     if warnings:
         for w in warnings:
-            print(f"  \u26a0  {w}")
+            emit(f"  \u26a0  {w}")
     else:
-        print("  \u2713  Print looks healthy")
+        emit("  \u2713  Print looks healthy")
 
-    print("=" * 60)
+    emit("=" * 60)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # =============================================================================
@@ -221,24 +254,25 @@ def compute_extrusion_quality(timeline):
 
     n = len(active)
 
+    # Pull each channel out once as a flat list.  Full-resolution timelines
+    # run to tens of thousands of points, so the reductions below work on
+    # these columns with zip/sum/max rather than per-index dict lookups.
+    flows = [pt.get('f', 0) for pt in active]
+    pwms = [pt.get('pw', 0) for pt in active]
+    accels = [pt.get('a', 0) for pt in active]
+    dynz_flags = [pt.get('dz', 0) for pt in active]
+
     # ------------------------------------------------------------------
     # 1. THERMAL STABILITY — what % of extrusion time is temp on-target?
     #    Direct correlation: temp deviation → viscosity change → banding
     # ------------------------------------------------------------------
-    temp_in_band = 0    # within ±1°C
-    temp_close = 0      # within ±2°C
-    temp_deviations = []
-    for pt in active:
-        dev = abs(pt.get('ta', 0) - pt.get('tt', 0))
-        temp_deviations.append(dev)
-        if dev <= 1.0:
-            temp_in_band += 1
-        if dev <= 2.0:
-            temp_close += 1
+    temp_deviations = [abs(pt.get('ta', 0) - pt.get('tt', 0)) for pt in active]
+    temp_in_band = sum(dev <= 1.0 for dev in temp_deviations)  # within ±1°C
+    temp_close = sum(dev <= 2.0 for dev in temp_deviations)    # within ±2°C
 
     pct_in_band = temp_in_band / n * 100
     pct_close = temp_close / n * 100
-    avg_dev = statistics.mean(temp_deviations) if temp_deviations else 0
+    avg_dev = statistics.fmean(temp_deviations) if temp_deviations else 0
     max_dev = max(temp_deviations) if temp_deviations else 0
 
     # Score: 100 if always in band, scales down.
@@ -250,14 +284,13 @@ def compute_extrusion_quality(timeline):
     #    Large sample-to-sample jumps = pressure transients = banding.
     #    This is what flow_smoothing is supposed to fix.
     # ------------------------------------------------------------------
-    flows = [pt.get('f', 0) for pt in active]
-    mean_flow = statistics.mean(flows)
+    mean_flow = statistics.fmean(flows)
     if mean_flow < 1.0:
         mean_flow = 1.0  # avoid div-by-zero on very low flow prints
 
     # Compute sample-to-sample flow deltas
-    flow_deltas = [abs(flows[i] - flows[i - 1]) for i in range(1, len(flows))]
-    avg_delta = statistics.mean(flow_deltas) if flow_deltas else 0
+    flow_deltas = [abs(cur - prev) for prev, cur in zip(flows, flows[1:])]
+    avg_delta = statistics.fmean(flow_deltas) if flow_deltas else 0
     # Normalize by mean flow: 0 = perfectly smooth, higher = jittery
     normalized_jitter = avg_delta / mean_flow
 
@@ -268,7 +301,7 @@ def compute_extrusion_quality(timeline):
     # Floor of 3.0 mm³/s avoids penalizing normal infill↔wall transitions
     # at moderate flow rates.
     big_threshold = max(3.0, mean_flow * 0.30)
-    big_jumps = sum(1 for d in flow_deltas if d > big_threshold)
+    big_jumps = sum(d > big_threshold for d in flow_deltas)
     big_jump_pct = big_jumps / max(len(flow_deltas), 1) * 100
 
     # Score: penalize jitter.  Calibrated so a typical mixed-move print
@@ -284,9 +317,9 @@ def compute_extrusion_quality(timeline):
     #    When PWM≥95% during extrusion, the heater can't respond to
     #    demand changes → temp drops → under-extrusion → banding.
     # ------------------------------------------------------------------
-    pwm_saturated = sum(1 for pt in active if pt.get('pw', 0) >= 0.95)
+    pwm_saturated = sum(pw >= 0.95 for pw in pwms)
     sat_pct = pwm_saturated / n * 100
-    avg_pwm = statistics.mean([pt.get('pw', 0) for pt in active])
+    avg_pwm = statistics.fmean(pwms)
 
     # Score: 100 if never saturated, 0 if always saturated.
     # Use 2x multiplier — sat_pct*3 was too harsh and made a working
@@ -310,15 +343,10 @@ def compute_extrusion_quality(timeline):
     #    EXCLUDES Speed Guard-driven accel changes — those are intentional quality
     #    protection, not slicer-induced pressure problems.
     # ------------------------------------------------------------------
-    accels = [pt.get('a', 0) for pt in active]
-    dynz_flags = [pt.get('dz', 0) for pt in active]
-    accel_deltas = [abs(accels[i] - accels[i - 1])
-                    for i in range(1, len(accels))]
-
     weighted_transients = []
     dynz_excluded = 0
-    for i in range(1, len(accels)):
-        ad = abs(accels[i] - accels[i - 1])
+    for i, (prev_a, cur_a) in enumerate(zip(accels, accels[1:]), 1):
+        ad = abs(cur_a - prev_a)
         if ad <= 200:
             continue
         # Skip transitions where Speed Guard is active on either side —
@@ -333,7 +361,7 @@ def compute_extrusion_quality(timeline):
             impact = (ad / 1000.0) * (fl / 10.0)
             weighted_transients.append(impact)
 
-    avg_transient = (statistics.mean(weighted_transients)
+    avg_transient = (statistics.fmean(weighted_transients)
                      if weighted_transients else 0)
     transient_count = len(weighted_transients)
     transient_pct = transient_count / max(n - 1, 1) * 100
@@ -394,8 +422,12 @@ def compute_extrusion_quality(timeline):
     }
 
 
-def analyze_csv_for_banding(csv_file):
-    """Deep analysis of a CSV log file for banding-related events."""
+def analyze_csv_for_banding(csv_file, rows=None):
+    """Deep analysis of a CSV log file for banding-related events.
+
+    Pass pre-loaded *rows* (from ``load_csv_rows``) to skip re-reading
+    the file.
+    """
     events = {
         'accel_spikes': [],
         'pa_oscillations': [],
@@ -404,15 +436,12 @@ def analyze_csv_for_banding(csv_file):
         'high_risk_moments': [],
     }
 
-    flow_values = []
-    pa_values = []
-    accel_values = []
+    flow_stats = _RunningStats()
+    pa_stats = _RunningStats()
+    accel_stats = _RunningStats()
 
-    try:
-        with open(csv_file, 'r') as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
+    def _scan(row_iter):
+        for row in row_iter:
                 try:
                     elapsed = float(row['elapsed_s'])
 
@@ -451,28 +480,37 @@ def analyze_csv_for_banding(csv_file):
                             'z': float(row.get('z_height', 0)),
                         })
 
-                    flow_values.append(float(row['flow']))
-                    if 'pa' in row and float(row['pa']) > 0:
-                        pa_values.append(float(row['pa']))
-                    if 'accel' in row and int(row['accel']) > 0:
-                        accel_values.append(int(row['accel']))
+                    flow_stats.update(float(row['flow']))
+                    if 'pa' in row:
+                        pa = float(row['pa'])
+                        if pa > 0:
+                            pa_stats.update(pa)
+                    if 'accel' in row:
+                        accel = int(row['accel'])
+                        if accel > 0:
+                            accel_stats.update(accel)
 
                 except (KeyError, ValueError):
                     continue
 
+    try:
+        if rows is not None:
+            _scan(rows)
+        else:
+            # Stream straight from the file — the CLI reports call this per
+            # session and don't need every row dict held in memory.
+            with open(csv_file, 'r') as f:
+                _scan(csv.DictReader(f))
     except Exception as exc:
         print(f"Warning: Could not analyze {csv_file}: {exc}")
         return None
 
-    def safe_stdev(data):
-        return statistics.stdev(data) if len(data) > 1 else 0.0
-
     return {
         'events': events,
         'variance': {
-            'flow_stdev': safe_stdev(flow_values) if flow_values else 0.0,
-            'pa_stdev': safe_stdev(pa_values) if pa_values else 0.0,
-            'accel_stdev': safe_stdev(accel_values) if accel_values else 0.0,
+            'flow_stdev': flow_stats.stdev,
+            'pa_stdev': pa_stats.stdev,
+            'accel_stdev': accel_stats.stdev,
         },
         'event_counts': {k: len(v) for k, v in events.items()},
     }
@@ -802,8 +840,8 @@ def print_trends(sessions):
         if len(values) < 2:
             return 'flat', 0.0
         mid = len(values) // 2
-        first = statistics.mean(values[:mid]) if mid > 0 else 0
-        second = statistics.mean(values[mid:]) if mid > 0 else 0
+        first = statistics.fmean(values[:mid]) if mid > 0 else 0
+        second = statistics.fmean(values[mid:]) if mid > 0 else 0
         delta = second - first
         pct = (delta / first * 100) if first != 0 else 0
         if abs(pct) < 5:
@@ -894,10 +932,10 @@ def analyze_thermal_lag(csv_file, lag_threshold=3.0, rows=None):
         print(f"Warning: Could not read {csv_file}: {exc}")
         return None
 
-    avg_lag = statistics.mean(all_lags) if all_lags else 0
+    avg_lag = statistics.fmean(all_lags) if all_lags else 0
     max_lag = max(all_lags) if all_lags else 0
     lag_pct = (sum(1 for l in all_lags if l >= lag_threshold) / len(all_lags) * 100) if all_lags else 0
-    avg_flow_at_lag = statistics.mean(flow_at_lag) if flow_at_lag else 0
+    avg_flow_at_lag = statistics.fmean(flow_at_lag) if flow_at_lag else 0
 
     return {
         'episodes': episodes,
@@ -987,6 +1025,9 @@ def analyze_heater_headroom(csv_file, flow_bins=None, rows=None):
         flow_bins = [0, 2, 5, 8, 10, 12, 15, 20, 25, 30, 40]
 
     brackets = defaultdict(lambda: {'pwm_values': [], 'count': 0})
+    # Bracket key per bisect index; the last bracket is open-ended.
+    bin_keys = [(flow_bins[j], flow_bins[j + 1]) for j in range(len(flow_bins) - 1)]
+    bin_keys.append((flow_bins[-1], float('inf')))
 
     try:
         _rows = rows if rows is not None else load_csv_rows(csv_file)
@@ -994,18 +1035,12 @@ def analyze_heater_headroom(csv_file, flow_bins=None, rows=None):
                 try:
                     flow = float(row['flow'])
                     pwm = float(row['pwm'])
-                    # Find the bracket
-                    for j in range(len(flow_bins) - 1):
-                        if flow_bins[j] <= flow < flow_bins[j + 1]:
-                            key = (flow_bins[j], flow_bins[j + 1])
-                            brackets[key]['pwm_values'].append(pwm)
-                            brackets[key]['count'] += 1
-                            break
-                    else:
-                        if flow >= flow_bins[-1]:
-                            key = (flow_bins[-1], float('inf'))
-                            brackets[key]['pwm_values'].append(pwm)
-                            brackets[key]['count'] += 1
+                    # Find the bracket (the edge check also rejects NaN)
+                    j = bisect_right(flow_bins, flow) - 1
+                    if j >= 0 and flow_bins[j] <= flow:
+                        b = brackets[bin_keys[j]]
+                        b['pwm_values'].append(pwm)
+                        b['count'] += 1
                 except (KeyError, ValueError):
                     continue
     except Exception as exc:
@@ -1017,7 +1052,7 @@ def analyze_heater_headroom(csv_file, flow_bins=None, rows=None):
         vals = brackets[key]['pwm_values']
         result[key] = {
             'count': brackets[key]['count'],
-            'avg_pwm': statistics.mean(vals) if vals else 0,
+            'avg_pwm': statistics.fmean(vals) if vals else 0,
             'max_pwm': max(vals) if vals else 0,
             'p95_pwm': sorted(vals)[int(len(vals) * 0.95)] if len(vals) >= 20 else max(vals) if vals else 0,
         }
@@ -1131,7 +1166,10 @@ def analyze_pa_stability(csv_file, window_s=10.0, rows=None):
     pa_values = [s['pa'] for s in samples]
     pa_min = min(pa_values)
     pa_max = max(pa_values)
-    pa_stdev = statistics.stdev(pa_values) if len(pa_values) > 1 else 0
+    pa_acc = _RunningStats()
+    for v in pa_values:
+        pa_acc.update(v)
+    pa_stdev = pa_acc.stdev
 
     # Count significant changes
     change_count = sum(1 for s in samples if abs(s['delta']) > 0.003)
@@ -1366,7 +1404,7 @@ def print_dynz_map(zones, bin_size=0.5):
               f"{v['avg_accel']:>10}  {v['avg_stress']:>6.1f}  {bar}{marker}")
 
     total_transitions = sum(v['transitions'] for v in zones.values())
-    avg_active = statistics.mean(v['active_pct'] for v in zones.values())
+    avg_active = statistics.fmean(v['active_pct'] for v in zones.values())
 
     print(f"\n\u2500" * 70)
     print("  SUMMARY")
@@ -1402,6 +1440,11 @@ def analyze_speed_flow_distribution(csv_file, rows=None):
     flow_brackets = defaultdict(lambda: {
         'count': 0, 'boost_sum': 0, 'pa_sum': 0, 'pwm_sum': 0,
     })
+    # Bracket key per bisect index; the last bracket is open-ended.
+    speed_keys = [(speed_edges[j], speed_edges[j + 1]) for j in range(len(speed_edges) - 1)]
+    speed_keys.append((speed_edges[-1], 999))
+    flow_keys = [(flow_edges[j], flow_edges[j + 1]) for j in range(len(flow_edges) - 1)]
+    flow_keys.append((flow_edges[-1], 999))
 
     try:
         _rows = rows if rows is not None else load_csv_rows(csv_file)
@@ -1413,39 +1456,18 @@ def analyze_speed_flow_distribution(csv_file, rows=None):
                     pa = float(row.get('pa', 0))
                     pwm = float(row.get('pwm', 0))
 
-                    placed = False
-                    for j in range(len(speed_edges) - 1):
-                        if speed_edges[j] <= speed < speed_edges[j + 1]:
-                            key = (speed_edges[j], speed_edges[j + 1])
-                            b = speed_brackets[key]
-                            b['count'] += 1
-                            b['boost_sum'] += boost
-                            b['pa_sum'] += pa
-                            b['pwm_sum'] += pwm
-                            placed = True
-                            break
-                    if not placed and speed >= speed_edges[-1]:
-                        key = (speed_edges[-1], 999)
-                        b = speed_brackets[key]
+                    # Binary search for the bracket (edge check rejects NaN)
+                    j = bisect_right(speed_edges, speed) - 1
+                    if j >= 0 and speed_edges[j] <= speed:
+                        b = speed_brackets[speed_keys[j]]
                         b['count'] += 1
                         b['boost_sum'] += boost
                         b['pa_sum'] += pa
                         b['pwm_sum'] += pwm
 
-                    placed = False
-                    for j in range(len(flow_edges) - 1):
-                        if flow_edges[j] <= flow < flow_edges[j + 1]:
-                            key = (flow_edges[j], flow_edges[j + 1])
-                            b = flow_brackets[key]
-                            b['count'] += 1
-                            b['boost_sum'] += boost
-                            b['pa_sum'] += pa
-                            b['pwm_sum'] += pwm
-                            placed = True
-                            break
-                    if not placed and flow >= flow_edges[-1]:
-                        key = (flow_edges[-1], 999)
-                        b = flow_brackets[key]
+                    j = bisect_right(flow_edges, flow) - 1
+                    if j >= 0 and flow_edges[j] <= flow:
+                        b = flow_brackets[flow_keys[j]]
                         b['count'] += 1
                         b['boost_sum'] += boost
                         b['pa_sum'] += pa
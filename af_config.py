@@ -82,15 +82,29 @@ _ALLOWED_VARIABLES = {
 }
 
 
+# Parsed config files keyed by path → ((st_mtime_ns, st_size), result).
+# The dashboard re-reads the same few .cfg files on every analysis; one
+# stat() replaces the exists() + full re-parse while the file is unchanged.
+# Callers treat the returned dict as read-only.
+_config_parse_cache = {}
+
+
 def _parse_config_variables(filepath):
     """Parse a Klipper config file into {section: {variable: value_str}}.
 
     Only reads ``variable_*`` lines (not commented-out ones).
     """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _config_parse_cache.get(filepath)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     result = {}
     current_section = None
-    if not os.path.exists(filepath):
-        return result
     try:
         with open(filepath) as f:
             for line in f:
@@ -103,7 +117,8 @@ def _parse_config_variables(filepath):
                     if len(parts) == 2:
                         result[current_section][parts[0].strip()] = parts[1].strip()
     except (IOError, OSError):
-        pass
+        return result
+    _config_parse_cache[filepath] = (stamp, result)
     return result
 
 
@@ -397,3 +412,33 @@ def load_csv_rows(csv_file):
         print(f"Warning: Could not read {csv_file}: {exc}")
         return []
 
+
+# =============================================================================
+# SHARED FILE DISCOVERY
+# =============================================================================
+
+def _newest_matching(directory, match):
+    """Return the path of the most recently modified file in *directory*
+    whose name satisfies ``match(name)``, or None.
+
+    Single ``os.scandir`` pass keeping a running maximum — one stat per
+    candidate and no sort.  Dotfiles are skipped (as ``Path.glob`` does)
+    and entries that vanish mid-scan are ignored.
+    """
+    latest = None
+    latest_mtime = None
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith('.') or not match(name):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest, latest_mtime = entry.path, mtime
+    except OSError:
+        return None
+    return latest
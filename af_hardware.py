@@ -58,18 +58,15 @@ def _parse_all_klipper_configs(config_dir):
     printer_cfg = os.path.join(config_dir, 'printer.cfg')
     merged = _parse_klipper_config(printer_cfg)
 
-    # Follow [include ...] directives from printer.cfg only (one level)
+    # Follow [include ...] directives from printer.cfg only (one level).
+    # _parse_klipper_config already recorded them as "include <file>"
+    # sections, so there is no need to read printer.cfg a second time.
     include_files = []
-    try:
-        with open(printer_cfg) as f:
-            for line in f:
-                s = line.strip()
-                if s.startswith('[include ') and s.endswith(']'):
-                    fname = s[9:-1].strip().split('#')[0].strip()
-                    if fname:
-                        include_files.append(fname)
-    except (IOError, OSError):
-        pass
+    for section in merged:
+        if section.startswith('include '):
+            fname = section[8:].split('#')[0].strip()
+            if fname:
+                include_files.append(fname)
 
     for fname in include_files:
         fpath = os.path.join(config_dir, fname)
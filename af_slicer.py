@@ -9,11 +9,9 @@ Also contains E3D Revo hotend flow-limit reference data.
 import os
 import re
 import math
-import statistics
 import logging
-from collections import deque
 
-from af_config import GCODES_DIR, _get_config_value, load_csv_rows
+from af_config import GCODES_DIR, _get_config_value, load_csv_rows, _newest_matching
 
 
 
@@ -43,8 +41,39 @@ _SLICER_OTHER_KEYS = [
 ]
 _SLICER_ALL_KEYS = set(_SLICER_ACCEL_KEYS + _SLICER_SPEED_KEYS + _SLICER_OTHER_KEYS)
 
-# Regex to parse ``; key = value`` lines in OrcaSlicer footer
-_SLICER_LINE_RE = re.compile(r'^\s*;\s*(\w+)\s*=\s*(.+?)\s*$')
+# Regex to parse ``; key = value`` lines in OrcaSlicer footer.  MULTILINE so
+# one findall() walks the whole footer buffer; ``[ \t]`` (not ``\s``) keeps
+# a match from running across line breaks.
+_SLICER_LINE_RE = re.compile(r'^[ \t]*;[ \t]*(\w+)[ \t]*=[ \t]*(.+?)[ \t\r]*$',
+                             re.MULTILINE)
+
+# OrcaSlicer time-estimate suffix on gcode names: 1h25m, 25m48s, 3h2m, etc.
+_GCODE_TIME_SUFFIX_RE = re.compile(r'^(.+?_)\d+[hm]\d+[ms]?$')
+
+
+def _tail_text(path, limit=2000, block=1 << 16):
+    """Return the last *limit* lines of *path* as a single decoded string.
+
+    Reads fixed-size blocks backwards from EOF so only the tail of a large
+    G-code file is touched, instead of streaming every line through Python.
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        chunks = []
+        newlines = 0
+        while pos > 0 and newlines <= limit:
+            start = max(0, pos - block)
+            f.seek(start)
+            chunk = f.read(pos - start)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+            pos = start
+    lines = b''.join(reversed(chunks)).split(b'\n')
+    if lines and lines[-1] == b'':
+        lines.pop()  # trailing newline at EOF
+    # With more than *limit* newlines read, the (possibly partial) first
+    # line is never among the last *limit*.
+    return b'\n'.join(lines[-limit:]).decode('utf-8', errors='replace')
 
 
 def extract_slicer_settings(gcode_path):
@@ -59,16 +88,12 @@ def extract_slicer_settings(gcode_path):
 
     settings = {}
     try:
-        # Read only the tail of the file — the config block is at the end.
-        # We use a deque-based approach to avoid reading 100k+ line files.
-        with open(gcode_path, 'r', errors='replace') as f:
-            tail = deque(f, maxlen=2000)
-        for line in tail:
-            m = _SLICER_LINE_RE.match(line)
-            if m:
-                key, val = m.group(1), m.group(2)
-                if key in _SLICER_ALL_KEYS:
-                    settings[key] = _parse_slicer_value(val)
+        # Read only the tail of the file — the config block is at the end —
+        # and match it in one findall() call rather than a regex per line.
+        tail = _tail_text(gcode_path, limit=2000)
+        for key, val in _SLICER_LINE_RE.findall(tail):
+            if key in _SLICER_ALL_KEYS:
+                settings[key] = _parse_slicer_value(val)
     except Exception as exc:
         print(f"Warning: Could not extract slicer settings from {gcode_path}: {exc}")
         return None
@@ -119,24 +144,14 @@ def _find_gcode_for_summary(summary, gcodes_dir=None):
     #    e.g. "Voron_Design_Cube_v7(R2)_PETG_25m48s.gcode"
     #       → prefix = "Voron_Design_Cube_v7(R2)_PETG_"
     base = os.path.splitext(filename)[0]  # remove .gcode
-    # OrcaSlicer time suffix pattern: 1h25m, 25m48s, 3h2m, etc.
-    m = re.match(r'^(.+?_)\d+[hm]\d+[ms]?$', base)
+    m = _GCODE_TIME_SUFFIX_RE.match(base)
     if m:
         prefix = m.group(1)
-        try:
-            candidates = [
-                f for f in os.listdir(gcodes_dir)
-                if f.startswith(prefix) and f.endswith('.gcode')
-            ]
-            if candidates:
-                # Pick the most recently modified one
-                candidates.sort(
-                    key=lambda f: os.path.getmtime(os.path.join(gcodes_dir, f)),
-                    reverse=True,
-                )
-                return os.path.join(gcodes_dir, candidates[0])
-        except OSError:
-            pass
+        # Pick the most recently modified match
+        return _newest_matching(
+            gcodes_dir,
+            lambda name: name.startswith(prefix) and name.endswith('.gcode'),
+        )
 
     return None
 
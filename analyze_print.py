@@ -29,21 +29,16 @@ This file is the main entry point.  Analysis logic is split across:
 import os
 import sys
 import json
-import csv
-import re
-import glob
+import hashlib
 import math
 import time
-import logging
 import statistics
 import argparse
 import http.server
 import urllib.parse
-import urllib.request
 import socket
-import subprocess
+import threading
 from pathlib import Path
-from collections import defaultdict
 
 # ---------------------------------------------------------------------------
 # Import shared helpers from sub-modules.  These re-export all public names
@@ -121,6 +116,12 @@ def read_csv_timeline(csv_file, max_points=800, rows=None):
     return out
 
 
+def downsample_timeline(timeline, max_points=800):
+    """Stride an already-parsed timeline down to at most ~*max_points*."""
+    step = max(1, len(timeline) // max_points)
+    return timeline[::step]
+
+
 def find_active_print_csv(log_dir):
     """Find a CSV that has no matching summary JSON — i.e., a print in progress.
 
@@ -164,12 +165,11 @@ def synthesize_live_summary(csv_path, rows=None):
             material = upper
             break
 
-    temps = []
-    boosts = []
-    pwms = []
-    flows = []
-    speeds = []
-    pa_vals = []
+    # Running sums/maxima instead of per-column lists: a live CSV can hold
+    # tens of thousands of rows and only avg/max are reported.
+    boost_sum = pwm_sum = 0.0
+    boost_max = pwm_max = -math.inf
+    n_valid = 0
     high_risk = 0
     dynz_active = 0
     accel_min = 99999
@@ -182,12 +182,18 @@ def synthesize_live_summary(csv_path, rows=None):
         for row in _rows:
                 try:
                     total += 1
-                    boosts.append(float(row.get('boost', 0)))
-                    pwms.append(float(row.get('pwm', 0)))
-                    flows.append(float(row.get('flow', 0)))
-                    speeds.append(float(row.get('speed', 0)))
-                    if float(row.get('pa', 0)) > 0:
-                        pa_vals.append(float(row['pa']))
+                    boost = float(row.get('boost', 0))
+                    pwm = float(row.get('pwm', 0))
+                    n_valid += 1
+                    boost_sum += boost
+                    boost_max = max(boost_max, boost)
+                    pwm_sum += pwm
+                    pwm_max = max(pwm_max, pwm)
+                    # flow/speed/pa aren't reported, but a malformed value
+                    # still marks the row as bad and skips the counts below.
+                    float(row.get('flow', 0))
+                    float(row.get('speed', 0))
+                    float(row.get('pa', 0))
                     z_h = float(row.get('z_height', 0))
                     past_first_layer = z_h > 0.5
                     if int(row.get('dynz_active', 0)) and past_first_layer:
@@ -212,10 +218,10 @@ def synthesize_live_summary(csv_path, rows=None):
         'start_time': '',
         'duration_min': round(duration_s / 60, 1),
         'samples': total,
-        'avg_boost': round(statistics.mean(boosts), 1) if boosts else 0,
-        'max_boost': round(max(boosts), 1) if boosts else 0,
-        'avg_pwm': round(statistics.mean(pwms), 3) if pwms else 0,
-        'max_pwm': round(max(pwms), 3) if pwms else 0,
+        'avg_boost': round(boost_sum / n_valid, 1) if n_valid else 0,
+        'max_boost': round(boost_max, 1) if n_valid else 0,
+        'avg_pwm': round(pwm_sum / n_valid, 3) if n_valid else 0,
+        'max_pwm': round(pwm_max, 3) if n_valid else 0,
         'dynz_active_pct': round(dynz_active / total * 100, 1) if total else 0,
         'accel_min': int(accel_min) if accel_min < 99999 else 0,
         'banding_analysis': {
@@ -501,10 +507,10 @@ def generate_recommendations(data):
                 normal_fan.append(fn)
 
         if len(sat_fan) >= 5 and active_pts > 0:
-            avg_sat_fan = statistics.mean(sat_fan)
-            avg_normal_fan = statistics.mean(normal_fan) if normal_fan else 0
+            avg_sat_fan = statistics.fmean(sat_fan)
+            avg_normal_fan = statistics.fmean(normal_fan) if normal_fan else 0
             max_drop = max(sat_drops)
-            avg_drop = statistics.mean(sat_drops)
+            avg_drop = statistics.fmean(sat_drops)
             sat_pct = len(sat_fan) / active_pts * 100
 
             # Fan-correlated: saturation happens while fan is delivering
@@ -1323,13 +1329,14 @@ def collect_dashboard_data(log_dir, summary_path=None, material=None):
             dz['active_pct'] = fresh['dynz_active_pct']
             dz['accel_min'] = fresh['accel_min']
 
-    data['timeline'] = read_csv_timeline(csv_path, rows=csv_rows)
-
     # --- Extrusion Quality Score (physics-based, replaces banding risk) ---
     # Use full-resolution data for quality scoring — the downsampled timeline
-    # skips samples and inflates apparent jitter / jump counts.
+    # skips samples and inflates apparent jitter / jump counts.  Parse the
+    # rows once and derive the chart timeline from it, rather than running
+    # a second float-conversion pass over the same rows.
     full_timeline = read_csv_timeline(csv_path, max_points=len(csv_rows),
                                       rows=csv_rows)
+    data['timeline'] = downsample_timeline(full_timeline)
     data['extrusion_quality'] = compute_extrusion_quality(full_timeline)
 
     data['z_banding'] = {
@@ -1427,7 +1434,7 @@ def collect_dashboard_data(log_dir, summary_path=None, material=None):
                 except (ValueError, TypeError):
                     pass
             # Run banding analysis for event data
-            banding_csv = analyze_csv_for_banding(csv_path)
+            banding_csv = analyze_csv_for_banding(csv_path, rows=csv_rows)
             slicer_diag = analyze_slicer_vs_banding(slicer, banding_csv, csv_accels)
     data['slicer_settings'] = slicer
     data['slicer_diagnosis'] = slicer_diag
@@ -1745,6 +1752,10 @@ var rt=null;
 if(isLive){arCb.checked=true; startPoll()}
 arCb.addEventListener('change',function(){
 if(this.checked)startPoll(); else stopPoll()});
+// Don't poll the printer host while the tab is hidden; catch up on return
+document.addEventListener('visibilitychange',function(){
+if(!arCb.checked)return;
+if(document.hidden)stopPoll(); else{pollData();startPoll()}});
 
 function startPoll(){
 stopPoll();
@@ -1754,11 +1765,18 @@ ftel.textContent='Auto-refresh '+(iv/1000)+'s'}
 function stopPoll(){if(rt)clearInterval(rt);rt=null;
 ftel.textContent='Adaptive Flow Dashboard'}
 
+var dTag=null;
 function pollData(){
 var url='/api/data';
 var cur=sel.value;
 if(cur&&cur!=='__live__')url+='?session='+encodeURIComponent(cur);
-fetch(url).then(function(r){return r.json()}).then(function(nd){
+// Conditional poll: a 304 means the data is unchanged, so skip the
+// JSON parse and redraw entirely.
+var hd=dTag?{'If-None-Match':dTag}:{};
+fetch(url,{headers:hd,cache:'no-store'}).then(function(r){
+if(r.status===304)return null;
+dTag=r.headers.get('ETag');return r.json()}).then(function(nd){
+if(!nd)return;
 D=nd;isLive=D.is_live||false;
 if(isLive)lvi.style.display='inline'; else lvi.style.display='none';
 rc();rCh();
@@ -2590,6 +2608,11 @@ class DashboardHandler(http.server.BaseHTTPRequestHandler):
     log_dir = LOG_DIR
     material = None
     timeout = 30  # seconds – prevents stale connections from blocking the server
+    # HTTP/1.1 keep-alive: the auto-refresh poll reuses one TCP connection
+    # instead of a new handshake every few seconds.  Every response must
+    # therefore carry a Content-Length (including empty error replies).
+    protocol_version = 'HTTP/1.1'
+    _collect_lock = threading.Lock()
 
     def _resolve_session(self, params):
         """Resolve session file from query params to summary path."""
@@ -2612,35 +2635,54 @@ class DashboardHandler(http.server.BaseHTTPRequestHandler):
             cache_key = f"api_data:{summary_path}:{self.material}"
             data = _cache_get(cache_key)
             if data is None:
-                try:
-                    data = collect_dashboard_data(
-                        self.log_dir,
-                        summary_path=summary_path,
-                        material=self.material,
-                    )
-                except Exception as exc:
-                    import traceback
-                    traceback.print_exc()
-                    data = {'error': str(exc)}
-                # Don't cache live prints (data changes every second)
-                if not data.get('is_live'):
-                    _cache_set(cache_key, data)
+                # Single-flight: with the threaded server, several tabs
+                # polling at once would otherwise each run the full analysis
+                # on a cache miss.  Serialise and re-check the cache so only
+                # the first request does the work.
+                with self._collect_lock:
+                    data = _cache_get(cache_key)
+                    if data is None:
+                        try:
+                            data = collect_dashboard_data(
+                                self.log_dir,
+                                summary_path=summary_path,
+                                material=self.material,
+                            )
+                        except Exception as exc:
+                            import traceback
+                            traceback.print_exc()
+                            data = {'error': str(exc)}
+                        # Don't cache live prints (data changes every second)
+                        if not data.get('is_live'):
+                            _cache_set(cache_key, data)
             payload = json.dumps(data, default=str).encode('utf-8', errors='replace')
+            # Content hash as ETag: when nothing changed since the last poll
+            # the browser gets a bodyless 304 and skips parse + re-render.
+            etag = '"%s"' % hashlib.sha1(payload).hexdigest()
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
             self.send_response(200)
             self.send_header('Content-Type', 'application/json; charset=utf-8')
             self.send_header('Content-Length', str(len(payload)))
             self.send_header('Cache-Control', 'no-cache')
+            self.send_header('ETag', etag)
             self.end_headers()
             self.wfile.write(payload)
 
         elif parsed.path in ('/', ''):
             summary_path = self._resolve_session(params)
             try:
-                data = collect_dashboard_data(
-                    self.log_dir,
-                    summary_path=summary_path,
-                    material=self.material,
-                )
+                # Same lock as /api/data so a page load never runs an
+                # analysis concurrently with a poll.
+                with self._collect_lock:
+                    data = collect_dashboard_data(
+                        self.log_dir,
+                        summary_path=summary_path,
+                        material=self.material,
+                    )
             except Exception as exc:
                 import traceback
                 traceback.print_exc()
@@ -2661,6 +2703,7 @@ class DashboardHandler(http.server.BaseHTTPRequestHandler):
             self.wfile.write(html)
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '0')
             self.end_headers()
 
     def do_POST(self):
@@ -2670,6 +2713,9 @@ class DashboardHandler(http.server.BaseHTTPRequestHandler):
             length = int(self.headers.get('Content-Length', 0))
             if length > 4096:
                 self.send_response(413)
+                self.send_header('Content-Length', '0')
+                # Body was not read — don't reuse the connection.
+                self.send_header('Connection', 'close')
                 self.end_headers()
                 return
             try:
@@ -2697,6 +2743,9 @@ class DashboardHandler(http.server.BaseHTTPRequestHandler):
             self.wfile.write(payload)
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '0')
+            # Body was not read — don't reuse the connection.
+            self.send_header('Connection', 'close')
             self.end_headers()
 
     def log_message(self, format, *args):
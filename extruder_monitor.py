@@ -208,9 +208,10 @@ class ExtruderMonitor:
             self._relative_extrusion = False
             return
         
-        params = {}
-        for m in self._param_re.finditer(line):
-            params[m.group(1).upper()] = float(m.group(2))
+        # findall() returns (letter, number) tuples straight from the C
+        # matcher — no match objects or group() calls per parameter.
+        params = {axis.upper(): float(val)
+                  for axis, val in self._param_re.findall(line)}
 
         cur_e = params.get('E', None)
         cur_f = params.get('F', None)
@@ -857,37 +858,41 @@ class ExtruderMonitor:
                     with open(summary_path, 'w') as f:
                         json.dump(summary, f, indent=2)
                     
-                    gcmd.respond_info(f"AT_LOG: Session ended - {samples} samples over {summary['duration_min']}min")
-                                        # BANDING RISK SUMMARY (NEW - shown first for visibility)
+                    # Collect the report and send it as one multi-line
+                    # respond_info: each call is a separate console message
+                    # pushed through the gcode/webhooks layer to every client.
+                    msg = [f"AT_LOG: Session ended - {samples} samples over {summary['duration_min']}min"]
+                    # BANDING RISK SUMMARY (shown first for visibility)
                     ba = summary['banding_analysis']
                     if ba['high_risk_events'] > 0 or ba['accel_changes'] > 10:
-                        gcmd.respond_info(f"⚠️  BANDING RISK DETECTED: {ba['high_risk_events']} high-risk events")
-                        gcmd.respond_info(f"  Likely culprit: {ba['likely_culprit']}")
-                        gcmd.respond_info(f"  Events: Accel changes:{ba['accel_changes']}, PA changes:{ba['pa_changes']}, Speed Guard transitions:{ba['dynz_transitions']}, Temp overshoots:{ba['temp_overshoots']}")
+                        msg.append(f"⚠️  BANDING RISK DETECTED: {ba['high_risk_events']} high-risk events")
+                        msg.append(f"  Likely culprit: {ba['likely_culprit']}")
+                        msg.append(f"  Events: Accel changes:{ba['accel_changes']}, PA changes:{ba['pa_changes']}, Speed Guard transitions:{ba['dynz_transitions']}, Temp overshoots:{ba['temp_overshoots']}")
                     else:
-                        gcmd.respond_info(f"✓ Banding risk low: avg {ba['avg_risk']:.1f}/10, {ba['high_risk_events']} high-risk events")
-                                        # Feature summary
+                        msg.append(f"✓ Banding risk low: avg {ba['avg_risk']:.1f}/10, {ba['high_risk_events']} high-risk events")
+                    # Feature summary
                     at = summary['auto_temp']
-                    gcmd.respond_info(f"AT_LOG: Temp: {at['temp_min']}-{at['temp_max']}C (range {at['temp_range']}C), Boost avg:{at['avg_boost']}C max:{at['max_boost']}C")
+                    msg.append(f"AT_LOG: Temp: {at['temp_min']}-{at['temp_max']}C (range {at['temp_range']}C), Boost avg:{at['avg_boost']}C max:{at['max_boost']}C")
                     
                     h = summary['heater']
-                    gcmd.respond_info(f"AT_LOG: Heater: PWM avg:{h['avg_pwm']:.1%} max:{h['max_pwm']:.1%}, at 100%: {h['pwm_maxed_pct']}% of print")
+                    msg.append(f"AT_LOG: Heater: PWM avg:{h['avg_pwm']:.1%} max:{h['max_pwm']:.1%}, at 100%: {h['pwm_maxed_pct']}% of print")
                     
                     f = summary['flow']
-                    gcmd.respond_info(f"AT_LOG: Flow: avg:{f['avg_flow']:.1f} max:{f['max_flow']:.1f} mm³/s, Speed max:{f['max_speed']:.0f}mm/s")
+                    msg.append(f"AT_LOG: Flow: avg:{f['avg_flow']:.1f} max:{f['max_flow']:.1f} mm³/s, Speed max:{f['max_speed']:.0f}mm/s")
                     
                     pa = summary['dynamic_pa']
                     if pa['pa_max'] > 0:
-                        gcmd.respond_info(f"AT_LOG: PA: {pa['pa_min']:.4f}-{pa['pa_max']:.4f} (range {pa['pa_range']:.4f})")
+                        msg.append(f"AT_LOG: PA: {pa['pa_min']:.4f}-{pa['pa_max']:.4f} (range {pa['pa_range']:.4f})")
                     
                     dz = summary['dynamic_z']
                     if dz['active_pct'] > 0:
-                        gcmd.respond_info(f"AT_LOG: Speed Guard: active {dz['active_pct']}% of print, min accel {dz['accel_min']}")
+                        msg.append(f"AT_LOG: Speed Guard: active {dz['active_pct']}% of print, min accel {dz['accel_min']}")
                     
                     fn = summary['fan']
-                    gcmd.respond_info(f"AT_LOG: Fan: {fn['fan_min']}-{fn['fan_max']}% (avg {fn['fan_avg']:.0f}%), {fn['fan_adjustments']} adjustments")
+                    msg.append(f"AT_LOG: Fan: {fn['fan_min']}-{fn['fan_max']}% (avg {fn['fan_avg']:.0f}%), {fn['fan_adjustments']} adjustments")
                     
-                    gcmd.respond_info(f"AT_LOG: Summary saved to {summary_path}")
+                    msg.append(f"AT_LOG: Summary saved to {summary_path}")
+                    gcmd.respond_info("\n".join(msg))
                     logger.info(f"Print log summary: {summary}")
                 
                 # Final flush before closing